@@ -8,47 +8,114 @@ Features:
 - PNG export functionality
 """
 
+import concurrent.futures
+import contextlib
+import functools
+import io
+import logging
 import os
+import pickle
+import string
 import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, colorchooser, filedialog, messagebox
 from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageFilter, ImageOps
 import numpy as np
 from typing import Tuple, List, Optional, Dict, Any
 
+log = logging.getLogger(__name__)
+
+
+# PIL >= 10 can rasterize its bundled default font at an arbitrary size
+_PIL_DEFAULT_FONT_ACCEPTS_SIZE = int(Image.__version__.split('.')[0]) >= 10
+
+# Candidate paths for the 'Default' font, keyed by sys.platform
+_FONT_CANDIDATES_BY_PLATFORM = {
+    'linux': [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/liberation-sans/LiberationSans-Regular.ttf",
+        "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+        "/usr/share/fonts/gnu-free/FreeSans.ttf",
+    ],
+    'win32': [
+        "C:\\Windows\\Fonts\\arial.ttf",
+        "C:\\Windows\\Fonts\\segoeui.ttf",
+    ],
+    'darwin': [
+        "/Library/Fonts/Arial.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ],
+}
+
+# Generic names that PIL might recognize on any platform
+_GENERIC_FONT_NAMES = ["DejaVuSans.ttf", "Arial.ttf", "Helvetica.ttf", "Arial", "Helvetica"]
+
+
+@functools.lru_cache(maxsize=256)
+def _load_truetype(font_path, font_size):
+    """Load a TrueType font, caching by (path, size) to avoid re-reading
+    the font file from disk on every preview update"""
+    return ImageFont.truetype(font_path, font_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_bbox(font_path, font_size, text):
+    """Measure text with the cached font, memoized across renders"""
+    return _load_truetype(font_path, font_size).getbbox(text)
+
+
+def _hex_to_rgb(color):
+    """Parse a '#RRGGBB' color string into an (r, g, b) tuple"""
+    return tuple(bytes.fromhex(color.lstrip('#')))
+
+
+def _make_horizontal_gradient(width, height, color1, color2):
+    """Build a horizontal gradient image between two '#RRGGBB' colors"""
+    # Degenerate gradient: skip the resample and do a plain fill
+    if color1 == color2:
+        return Image.new('RGBA', (width, height), (*_hex_to_rgb(color1), 255))
+
+    # One horizontal color ramp over the columns, broadcast down the rows.
+    # (Resizing a 2x1 image instead clamps at the endpoints and leaves the
+    # outer quarters of the gradient flat)
+    c1 = np.array(_hex_to_rgb(color1), dtype=np.float32)
+    c2 = np.array(_hex_to_rgb(color2), dtype=np.float32)
+    xs = np.linspace(0, 1, width, dtype=np.float32)[:, None]
+    row = np.empty((width, 4), dtype=np.uint8)
+    row[:, :3] = (c1 + (c2 - c1) * xs).astype(np.uint8)
+    row[:, 3] = 255
+    arr = np.broadcast_to(row[None, :, :], (height, width, 4))
+    return Image.fromarray(np.ascontiguousarray(arr), 'RGBA')
+
+
 class GradientFrame(ttk.Frame):
     """A frame with a gradient background"""
     def __init__(self, parent, color1, color2, **kwargs):
         super().__init__(parent, **kwargs)
         self.color1 = color1
         self.color2 = color2
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        self._image_id = None
         self.bind("<Configure>", self._create_gradient)
         
     def _create_gradient(self, event=None):
         width = self.winfo_width()
         height = self.winfo_height()
-        
-        # Create gradient image
-        gradient_img = Image.new('RGBA', (width, height), color=self.color1)
-        draw = ImageDraw.Draw(gradient_img)
-        
-        # Draw gradient (horizontal)
-        for i in range(width):
-            r1, g1, b1 = int(self.color1[1:3], 16), int(self.color1[3:5], 16), int(self.color1[5:7], 16)
-            r2, g2, b2 = int(self.color2[1:3], 16), int(self.color2[3:5], 16), int(self.color2[5:7], 16)
-            
-            # Calculate gradient color at position
-            r = int(r1 + (r2 - r1) * i / width)
-            g = int(g1 + (g2 - g1) * i / width)
-            b = int(b1 + (b2 - b1) * i / width)
-            
-            # Draw vertical line with the calculated color
-            draw.line([(i, 0), (i, height)], fill=(r, g, b, 255))
-        
+
+        gradient_img = _make_horizontal_gradient(width, height, self.color1, self.color2)
+
         self.gradient = ImageTk.PhotoImage(gradient_img)
-        self.canvas = tk.Canvas(self, width=width, height=height, highlightthickness=0)
-        self.canvas.pack(fill="both", expand=True)
-        self.canvas.create_image(0, 0, anchor="nw", image=self.gradient)
+        self.canvas.config(width=width, height=height)
+        if self._image_id is None:
+            self._image_id = self.canvas.create_image(0, 0, anchor="nw", image=self.gradient)
+        else:
+            self.canvas.itemconfigure(self._image_id, image=self.gradient)
 
 
 class ColorSelector(ttk.Frame):
@@ -129,10 +196,6 @@ class ColorSelector(ttk.Frame):
         style = ttk.Style()
         style.configure("ColorFrame.TFrame", background=self.color1)
         style.configure("Color2Frame.TFrame", background=self.color2)
-        
-        # Force redraw
-        self.color_frame.update_idletasks()
-        self.color2_frame.update_idletasks()
     
     def get_colors(self):
         if self.is_gradient.get():
@@ -176,7 +239,25 @@ class LogoDesigner(tk.Tk):
         self.depth = tk.IntVar(value=5)
         self.canvas_width = tk.IntVar(value=500)
         self.canvas_height = tk.IntVar(value=500)
-        
+
+        # Pending debounced preview update (after() callback id)
+        self._preview_job = None
+        # When True, preview updates are suppressed until the batch ends
+        self._suspend_preview = False
+        # Inputs and output of the most recent render, so no-op events and
+        # repeat saves can reuse the previous image
+        self._last_state = None
+        self._last_render = None
+        self._displayed_state = None
+
+        # Font fallback caches: scaled default fonts by (path, size), and
+        # the result of the one-time default-system-font probe
+        self._scaled_font_cache = {}
+        self._default_system_font = None
+        # On-disk cache of font-file probe results, fc-cache style
+        self._font_cache_path = os.path.join(os.path.expanduser("~"),
+                                             ".logo_designer", "fonts.pkl")
+
         # Create sidebar controls
         self._create_sidebar_controls()
         
@@ -184,10 +265,15 @@ class LogoDesigner(tk.Tk):
         self.preview_frame = ttk.Frame(self.content, borderwidth=2, relief="groove")
         self.preview_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
-        self.canvas = tk.Canvas(self.preview_frame, width=500, height=500, 
+        self.canvas = tk.Canvas(self.preview_frame, width=500, height=500,
                              background="white", highlightthickness=1, highlightbackground="gray")
         self.canvas.pack(fill="both", expand=True, padx=10, pady=10)
-        
+
+        # Reusable Tk image buffer for the preview; recreated only when the
+        # canvas dimensions change
+        self._preview_photo = None
+        self._preview_item = None
+
         # Create button bar
         self.button_bar = ttk.Frame(self.content)
         self.button_bar.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
@@ -196,8 +282,12 @@ class LogoDesigner(tk.Tk):
         ttk.Button(self.button_bar, text="Save Logo", command=self.save_logo).pack(side="right", padx=5)
         ttk.Button(self.button_bar, text="Reset", command=self.reset_design).pack(side="right", padx=5)
         
-        # Load available fonts
-        self._load_fonts()
+        # Start with just the default font and scan the system in the
+        # background so the window appears immediately
+        self.font_paths = {"Default": "default"}
+        self.font_combo['values'] = ["Default"]
+        self.selected_font.set("Default")
+        threading.Thread(target=self._load_fonts_bg, daemon=True).start()
         
         # Generate initial preview
         self.update_preview()
@@ -208,13 +298,13 @@ class LogoDesigner(tk.Tk):
         ttk.Label(self.sidebar, text="Logo Text:").pack(anchor="w", padx=5, pady=5)
         text_entry = ttk.Entry(self.sidebar, textvariable=self.logo_text)
         text_entry.pack(fill="x", padx=5, pady=5)
-        text_entry.bind("<KeyRelease>", lambda e: self.update_preview())
+        text_entry.bind("<KeyRelease>", lambda e: self._schedule_preview())
         
         # Font selection
         ttk.Label(self.sidebar, text="Font:").pack(anchor="w", padx=5, pady=5)
         self.font_combo = ttk.Combobox(self.sidebar, textvariable=self.selected_font, state="readonly")
         self.font_combo.pack(fill="x", padx=5, pady=5)
-        self.font_combo.bind("<<ComboboxSelected>>", lambda e: self.update_preview())
+        self.font_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_preview())
         
         # Font size
         ttk.Label(self.sidebar, text="Font Size:").pack(anchor="w", padx=5, pady=5)
@@ -235,7 +325,7 @@ class LogoDesigner(tk.Tk):
         self.depth_frame = ttk.Frame(self.sidebar)
         ttk.Label(self.depth_frame, text="3D Depth:").pack(anchor="w", padx=5, pady=5)
         depth_slider = ttk.Scale(self.depth_frame, from_=1, to=20, variable=self.depth, 
-                              orient="horizontal", command=lambda e: self.update_preview())
+                              orient="horizontal", command=lambda e: self._schedule_preview())
         depth_slider.pack(fill="x", padx=5, pady=5)
         
         # Canvas size
@@ -257,22 +347,31 @@ class LogoDesigner(tk.Tk):
         # Text Color
         self.text_color = ColorSelector(self.sidebar, "Text Color:", 
                                      initial_color="#000000", 
-                                     callback=self.update_preview)
+                                     callback=self._schedule_preview)
         self.text_color.pack(fill="x", padx=5, pady=10)
         
         # Background Color
         self.bg_color = ColorSelector(self.sidebar, "Background Color:", 
                                     initial_color="#FFFFFF", 
-                                    callback=self.update_preview)
+                                    callback=self._schedule_preview)
         self.bg_color.pack(fill="x", padx=5, pady=10)
     
-    def _load_fonts(self):
-        """Load available fonts for the combo box"""
-        print("Looking for available fonts on your system...")
-        
-        # Find available system fonts
+    def _load_fonts_bg(self):
+        """Scan for system fonts on a background thread"""
+        log.debug("Looking for available fonts on your system...")
+        start = time.perf_counter()
         font_list = self._find_system_fonts()
-        
+        log.info("Loaded %d fonts in %.1fs", len(font_list), time.perf_counter() - start)
+
+        # Marshal the result back onto the Tk thread; the window may already
+        # be gone if the user closed it mid-scan
+        try:
+            self.after(0, self._apply_font_list, font_list)
+        except tk.TclError:
+            pass
+    
+    def _apply_font_list(self, font_list):
+        """Populate the font dropdown once the background scan finishes"""
         # Store the font paths for later use
         self.font_paths = {name: path for name, path in font_list}
         
@@ -281,8 +380,8 @@ class LogoDesigner(tk.Tk):
         
         # Check if we found any fonts
         if len(font_names) <= 1:  # Just "Default"
-            print("Warning: No system fonts found. Only the default font will be available.")
-            print("You may want to install additional fonts using the install_fonts.sh script.")
+            log.warning("No system fonts found. Only the default font will be available.")
+            log.warning("You may want to install additional fonts using the install_fonts.sh script.")
             
             # Make sure "Default" is always available
             if "Default" not in font_names:
@@ -290,7 +389,7 @@ class LogoDesigner(tk.Tk):
                 self.font_paths["Default"] = "default"
                 font_names = [name for name, _ in font_list]
         else:
-            print(f"Found {len(font_names)} fonts on your system.")
+            log.debug("Found %d fonts on your system.", len(font_names))
         
         # Update combobox
         self.font_combo['values'] = font_names
@@ -304,6 +403,9 @@ class LogoDesigner(tk.Tk):
                 self.selected_font.set("Arial")
             else:
                 self.selected_font.set(font_names[0])
+        
+        # Re-render with the newly selected font
+        self._schedule_preview()
     
     def on_font_size_change(self, value):
         """Update the font size label and refresh the preview"""
@@ -320,8 +422,8 @@ class LogoDesigner(tk.Tk):
         # Force to integer to avoid any issues
         self.font_size.set(int(size))
         
-        # Update the preview with a slight delay to ensure variable is updated
-        self.after(10, self.update_preview)
+        # Coalesce the burst of Scale callbacks into a single redraw
+        self._schedule_preview()
     
     def toggle_3d(self):
         """Show/hide 3D depth controls based on the 3D toggle"""
@@ -346,162 +448,205 @@ class LogoDesigner(tk.Tk):
         self.update_preview()
     
     def update_preview(self):
-        """Update the logo preview based on current settings"""
-        try:
-            # Create a new image with the current canvas size
-            width = self.canvas_width.get()
-            height = self.canvas_height.get()
-            
-            # Make sure we have the latest font size
-            current_font_size = self.font_size.get()
-            # Update the size value label if it exists
-            if hasattr(self, 'size_value_label'):
-                self.size_value_label.config(text=f"Size: {current_font_size}")
-            
-            # Create background
-            bg_colors = self.bg_color.get_colors()
-            if len(bg_colors) == 1:
-                # Solid background
-                background = Image.new('RGBA', (width, height), color=bg_colors[0])
-            else:
-                # Gradient background
-                background = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-                draw = ImageDraw.Draw(background)
-                
-                try:
-                    for i in range(width):
-                        # Parse colors
-                        r1, g1, b1 = int(bg_colors[0][1:3], 16), int(bg_colors[0][3:5], 16), int(bg_colors[0][5:7], 16)
-                        r2, g2, b2 = int(bg_colors[1][1:3], 16), int(bg_colors[1][3:5], 16), int(bg_colors[1][5:7], 16)
-                        
-                        # Calculate gradient color at position
-                        r = int(r1 + (r2 - r1) * i / width)
-                        g = int(g1 + (g2 - g1) * i / width)
-                        b = int(b1 + (b2 - b1) * i / width)
-                        
-                        # Draw vertical line with the calculated color
-                        draw.line([(i, 0), (i, height)], fill=(r, g, b, 255))
-                except (ValueError, IndexError) as e:
-                    print(f"Error creating gradient background: {e}")
-                    # Fall back to solid color
-                    background = Image.new('RGBA', (width, height), color="#FFFFFF")
-            
-            # Get text and font information
-            text = self.logo_text.get()
-            font_name = self.selected_font.get()
-            font_size = self.font_size.get()
-            text_colors = self.text_color.get_colors()
-            
-            # Create a blank image for drawing text
+        """Request a preview refresh (debounced)"""
+        self._schedule_preview()
+
+    def _schedule_preview(self):
+        """Coalesce bursts of events (slider drags, typing) into one redraw"""
+        if self._suspend_preview:
+            return
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(30, self._do_update_preview)
+
+    def _render_state(self):
+        """Snapshot of every input that affects the rendered logo"""
+        return (self.logo_text.get(), self.selected_font.get(), self.font_size.get(),
+                self.is_3d.get(), self.depth.get(),
+                self.canvas_width.get(), self.canvas_height.get(),
+                self.text_color.get_colors(), self.bg_color.get_colors())
+
+    def _render_logo(self, width, height):
+        """Render the logo at the given size and return it as a PIL image
+
+        Shared by the preview and the PNG export so both paths go through
+        the same (optimized) pipeline. Re-renders only when some input
+        changed since the previous call.
+        """
+        state = self._render_state()
+        if state == self._last_state and self._last_render is not None:
+            return self._last_render
+
+        # Create background
+        bg_colors = self.bg_color.get_colors()
+        if len(bg_colors) == 1:
+            # Solid background
+            background = Image.new('RGBA', (width, height),
+                                   color=(*_hex_to_rgb(bg_colors[0]), 255))
+        else:
+            # Gradient background
+            try:
+                background = _make_horizontal_gradient(width, height, bg_colors[0], bg_colors[1])
+            except (ValueError, IndexError) as e:
+                print(f"Error creating gradient background: {e}")
+                # Fall back to solid color
+                background = Image.new('RGBA', (width, height), color=(255, 255, 255, 255))
+        
+        # Get text and font information
+        text = self.logo_text.get()
+        font_name = self.selected_font.get()
+        font_size = self.font_size.get()
+        text_colors = self.text_color.get_colors()
+        
+        # With no 3D pass and no gradient, the text can go straight onto
+        # the background, skipping the extra layer and final composite
+        need_layer = self.is_3d.get() or len(text_colors) > 1
+        if need_layer:
             text_layer = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
             draw = ImageDraw.Draw(text_layer)
-            
-            # Get the correct font path and create the font
+        else:
+            text_layer = None
+            draw = ImageDraw.Draw(background)
+        
+        # Get the correct font path and create the font
+        try:
+            font_path = self._get_font_path(font_name)
+            font = self._better_font_selection(font_path, font_size)
+        except Exception as e:
+            print(f"Error loading font: {e}")
+            # Fall back to default font
+            font = ImageFont.load_default()
+        
+        # Calculate text size to center it
+        try:
+            if isinstance(font, ImageFont.FreeTypeFont) and getattr(font, 'path', None) == font_path:
+                # The font really was loaded from font_path, so the memoized
+                # bbox is valid and unrelated slider ticks skip the FreeType
+                # call. Fallback fonts resolved to some other path (or to the
+                # internal default) are measured directly instead
+                left, top, right, bottom = _text_bbox(font_path, font_size, text)
+            else:
+                left, top, right, bottom = font.getbbox(text)
+            text_width = right - left
+            text_height = bottom - top
+            text_x = (width - text_width) // 2
+            text_y = (height - text_height) // 2
+        except Exception as e:
+            print(f"Error calculating text size: {e}")
+            # Use default values
+            left = top = 0
+            text_width = width // 2
+            text_height = height // 4
+            text_x = width // 4
+            text_y = height // 3
+        
+        # Apply 3D effect if enabled
+        if self.is_3d.get():
             try:
-                font_path = self._get_font_path(font_name)
-                font = self._better_font_selection(font_path, font_size)
+                depth = self.depth.get()
+                
+                # Precompute every depth-layer color in one vectorized step
+                base = np.array(_hex_to_rgb(text_colors[0]), dtype=np.float32)
+                factors = 0.7 - 0.5 * np.arange(depth, 0, -1) / depth
+                offset_colors = (base * factors[:, None]).astype(np.uint8).tolist()
+                
+                # Create 3D effect by drawing multiple layers with decreasing intensity
+                for i, (r, g, b) in zip(range(depth, 0, -1), offset_colors):
+                    draw.text((text_x + i, text_y + i), text, font=font, fill=(r, g, b, 255))
             except Exception as e:
-                print(f"Error loading font: {e}")
-                # Fall back to default font
-                font = ImageFont.load_default()
-            
-            # Calculate text size to center it
+                print(f"Error rendering 3D effect: {e}")
+        
+        # Draw the main text
+        try:
+            if len(text_colors) == 1:
+                # Solid text color
+                draw.text((text_x, text_y), text, font=font, fill=text_colors[0])
+            elif text_width > 0 and text_height > 0:
+                # For gradient text, build the mask and gradient only at the
+                # glyph bounding box instead of as full-canvas images
+                mask = Image.new('L', (text_width, text_height), 0)
+                mask_draw = ImageDraw.Draw(mask)
+                mask_draw.text((-left, -top), text, font=font, fill=255)
+
+                # One vertical color ramp over the glyph rows, broadcast
+                # across the glyph width
+                c1 = np.array(_hex_to_rgb(text_colors[0]), dtype=np.float32)
+                c2 = np.array(_hex_to_rgb(text_colors[1]), dtype=np.float32)
+                ys = np.linspace(0, 1, text_height, dtype=np.float32)[:, None]
+                colors = (c1 + (c2 - c1) * ys).astype(np.uint8)
+                arr = np.broadcast_to(colors[:, None, :], (text_height, text_width, 3))
+                gradient = Image.fromarray(np.ascontiguousarray(arr), 'RGB')
+
+                # Paste the tinted glyphs onto the text layer in one pass
+                text_layer.paste(gradient, (text_x + left, text_y + top), mask)
+        except Exception as e:
+            print(f"Error rendering text: {e}")
+            # Try a simpler approach
             try:
-                left, top, right, bottom = font.getbbox(text)
-                text_width = right - left
-                text_height = bottom - top
-                text_x = (width - text_width) // 2
-                text_y = (height - text_height) // 2
-            except Exception as e:
-                print(f"Error calculating text size: {e}")
-                # Use default values
-                text_width = width // 2
-                text_height = height // 4
-                text_x = width // 4
-                text_y = height // 3
-            
-            # Apply 3D effect if enabled
-            if self.is_3d.get():
-                try:
-                    depth = self.depth.get()
-                    
-                    # Parse text color
-                    r, g, b = int(text_colors[0][1:3], 16), int(text_colors[0][3:5], 16), int(text_colors[0][5:7], 16)
-                    
-                    # Create 3D effect by drawing multiple layers with decreasing intensity
-                    for i in range(depth, 0, -1):
-                        # Calculate offset color (darker for depth)
-                        depth_factor = 0.7 - (0.5 * i / depth)
-                        offset_color = (int(r * depth_factor), int(g * depth_factor), int(b * depth_factor), 255)
-                        
-                        # Draw offset text
-                        draw.text((text_x + i, text_y + i), text, font=font, fill=offset_color)
-                except Exception as e:
-                    print(f"Error rendering 3D effect: {e}")
-            
-            # Draw the main text
+                draw.text((width//4, height//4), text, font=font, fill="#000000")
+            except Exception:
+                print("Failed to render text with any method")
+        
+        # Combine background and text. Both background variants are fully
+        # opaque, so a masked paste blends in one pass instead of a full
+        # alpha_composite
+        if text_layer is not None:
+            background.paste(text_layer, (0, 0), text_layer)
+
+        self._last_state = state
+        self._last_render = background
+        return background
+
+    def _do_update_preview(self):
+        """Update the logo preview based on current settings"""
+        self._preview_job = None
+        try:
+            width = self.canvas_width.get()
+            height = self.canvas_height.get()
+
+            # Make sure the size label tracks the latest font size
+            if hasattr(self, 'size_value_label'):
+                self.size_value_label.config(text=f"Size: {self.font_size.get()}")
+
+            # Skip the whole update when the displayed preview is current
+            state = self._render_state()
+            if state == self._displayed_state:
+                return
+
+            final_image = self._render_logo(width, height)
+
             try:
-                if len(text_colors) == 1:
-                    # Solid text color
-                    draw.text((text_x, text_y), text, font=font, fill=text_colors[0])
+                # Display the preview, reusing the existing PhotoImage buffer
+                # when the size is unchanged
+                if (self._preview_photo is None or
+                        (self._preview_photo.width(), self._preview_photo.height()) != final_image.size):
+                    self._preview_photo = ImageTk.PhotoImage(final_image)
+                    if self._preview_item is None:
+                        self._preview_item = self.canvas.create_image(0, 0, anchor="nw",
+                                                                      image=self._preview_photo)
+                    else:
+                        self.canvas.itemconfigure(self._preview_item, image=self._preview_photo)
                 else:
-                    # For gradient text, we need to create a mask and apply colors
-                    # Create a mask with the text
-                    mask = Image.new('L', (width, height), 0)
-                    mask_draw = ImageDraw.Draw(mask)
-                    mask_draw.text((text_x, text_y), text, font=font, fill=255)
-                    
-                    # Create a gradient image for the text
-                    gradient = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-                    grad_draw = ImageDraw.Draw(gradient)
-                    
-                    r1, g1, b1 = int(text_colors[0][1:3], 16), int(text_colors[0][3:5], 16), int(text_colors[0][5:7], 16)
-                    r2, g2, b2 = int(text_colors[1][1:3], 16), int(text_colors[1][3:5], 16), int(text_colors[1][5:7], 16)
-                    
-                    for y in range(text_height):
-                        # Calculate color at this position
-                        r = int(r1 + (r2 - r1) * y / text_height)
-                        g = int(g1 + (g2 - g1) * y / text_height)
-                        b = int(b1 + (b2 - b1) * y / text_height)
-                        
-                        # Draw a horizontal line with this color
-                        y_pos = text_y + y
-                        if 0 <= y_pos < height:  # Ensure we're drawing within the image
-                            grad_draw.line([(0, y_pos), (width, y_pos)], fill=(r, g, b, 255))
-                    
-                    # Apply the mask to the gradient
-                    gradient.putalpha(mask)
-                    
-                    # Paste the gradient text onto the text layer
-                    text_layer = Image.alpha_composite(text_layer, gradient)
-            except Exception as e:
-                print(f"Error rendering text: {e}")
-                # Try a simpler approach
-                try:
-                    draw.text((width//4, height//4), text, font=font, fill="#000000")
-                except Exception:
-                    print("Failed to render text with any method")
-            
-            # Combine background and text
-            try:
-                final_image = Image.alpha_composite(background, text_layer)
-                
-                # Display the preview
-                self.preview_image = ImageTk.PhotoImage(final_image)
-                self.canvas.delete("all")
-                self.canvas.create_image(0, 0, anchor="nw", image=self.preview_image)
+                    self._preview_photo.paste(final_image)
+                self._displayed_state = state
             except Exception as e:
                 print(f"Error displaying preview: {e}")
                 # Create a simple error message on canvas
                 self.canvas.delete("all")
-                self.canvas.create_text(width//2, height//2, text="Error rendering preview", 
+                self._preview_item = None
+                self._preview_photo = None
+                self._displayed_state = None
+                self.canvas.create_text(width//2, height//2, text="Error rendering preview",
                                      fill="red", font=("TkDefaultFont", 16))
-        
+
         except Exception as e:
             print(f"Unexpected error in update_preview: {e}")
             # Show error on canvas
             self.canvas.delete("all")
-            self.canvas.create_text(self.canvas.winfo_width()//2, self.canvas.winfo_height()//2, 
+            self._preview_item = None
+            self._preview_photo = None
+            self._displayed_state = None
+            self.canvas.create_text(self.canvas.winfo_width()//2, self.canvas.winfo_height()//2,
                                  text="Error updating preview", fill="red", font=("TkDefaultFont", 16))
     
     def save_logo(self):
@@ -513,107 +658,8 @@ class LogoDesigner(tk.Tk):
         if not filepath:
             return  # User cancelled
         
-        # Generate the logo image
-        width = self.canvas_width.get()
-        height = self.canvas_height.get()
-        
-        # Create background
-        bg_colors = self.bg_color.get_colors()
-        if len(bg_colors) == 1:
-            # Solid background
-            background = Image.new('RGBA', (width, height), color=bg_colors[0])
-        else:
-            # Gradient background
-            background = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-            draw = ImageDraw.Draw(background)
-            
-            for i in range(width):
-                # Parse colors
-                r1, g1, b1 = int(bg_colors[0][1:3], 16), int(bg_colors[0][3:5], 16), int(bg_colors[0][5:7], 16)
-                r2, g2, b2 = int(bg_colors[1][1:3], 16), int(bg_colors[1][3:5], 16), int(bg_colors[1][5:7], 16)
-                
-                # Calculate gradient color at position
-                r = int(r1 + (r2 - r1) * i / width)
-                g = int(g1 + (g2 - g1) * i / width)
-                b = int(b1 + (b2 - b1) * i / width)
-                
-                # Draw vertical line with the calculated color
-                draw.line([(i, 0), (i, height)], fill=(r, g, b, 255))
-        
-        # Get text and font information
-        text = self.logo_text.get()
-        font_name = self.selected_font.get()
-        font_size = self.font_size.get()
-        text_colors = self.text_color.get_colors()
-        
-        # Create a blank image for drawing text
-        text_layer = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-        draw = ImageDraw.Draw(text_layer)
-        
-        # Get the correct font path and create the font
-        font_path = self._get_font_path(font_name)
-        font = self._better_font_selection(font_path, font_size)
-        
-        # Calculate text size to center it
-        left, top, right, bottom = font.getbbox(text)
-        text_width = right - left
-        text_height = bottom - top
-        text_x = (width - text_width) // 2
-        text_y = (height - text_height) // 2
-        
-        # Apply 3D effect if enabled
-        if self.is_3d.get():
-            depth = self.depth.get()
-            
-            # Parse text color
-            r, g, b = int(text_colors[0][1:3], 16), int(text_colors[0][3:5], 16), int(text_colors[0][5:7], 16)
-            
-            # Create 3D effect by drawing multiple layers with decreasing intensity
-            for i in range(depth, 0, -1):
-                # Calculate offset color (darker for depth)
-                depth_factor = 0.7 - (0.5 * i / depth)
-                offset_color = (int(r * depth_factor), int(g * depth_factor), int(b * depth_factor), 255)
-                
-                # Draw offset text
-                draw.text((text_x + i, text_y + i), text, font=font, fill=offset_color)
-        
-        # Draw the main text
-        if len(text_colors) == 1:
-            # Solid text color
-            draw.text((text_x, text_y), text, font=font, fill=text_colors[0])
-        else:
-            # For gradient text, we need to create a mask and apply colors
-            # Create a mask with the text
-            mask = Image.new('L', (width, height), 0)
-            mask_draw = ImageDraw.Draw(mask)
-            mask_draw.text((text_x, text_y), text, font=font, fill=255)
-            
-            # Create a gradient image for the text
-            gradient = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-            grad_draw = ImageDraw.Draw(gradient)
-            
-            r1, g1, b1 = int(text_colors[0][1:3], 16), int(text_colors[0][3:5], 16), int(text_colors[0][5:7], 16)
-            r2, g2, b2 = int(text_colors[1][1:3], 16), int(text_colors[1][3:5], 16), int(text_colors[1][5:7], 16)
-            
-            for y in range(text_height):
-                # Calculate color at this position
-                r = int(r1 + (r2 - r1) * y / text_height)
-                g = int(g1 + (g2 - g1) * y / text_height)
-                b = int(b1 + (b2 - b1) * y / text_height)
-                
-                # Draw a horizontal line with this color
-                y_pos = text_y + y
-                if 0 <= y_pos < height:  # Ensure we're drawing within the image
-                    grad_draw.line([(0, y_pos), (width, y_pos)], fill=(r, g, b, 255))
-            
-            # Apply the mask to the gradient
-            gradient.putalpha(mask)
-            
-            # Paste the gradient text onto the text layer
-            text_layer = Image.alpha_composite(text_layer, gradient)
-        
-        # Combine background and text
-        final_image = Image.alpha_composite(background, text_layer)
+        # Generate the logo image at the current canvas size
+        final_image = self._render_logo(self.canvas_width.get(), self.canvas_height.get())
         
         # Save the image
         try:
@@ -622,36 +668,44 @@ class LogoDesigner(tk.Tk):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save logo: {str(e)}")
     
+    @contextlib.contextmanager
+    def _batch(self):
+        """Suspend preview updates over a series of changes, then redraw once"""
+        self._suspend_preview = True
+        try:
+            yield
+        finally:
+            self._suspend_preview = False
+            self._do_update_preview()
+
     def reset_design(self):
         """Reset all design options to defaults"""
-        self.logo_text.set("A")
-        self.font_size.set(72)
-        self.is_3d.set(False)
-        self.depth.set(5)
-        self.canvas_width.set(500)
-        self.canvas_height.set(500)
-        
-        # Reset color selectors
-        self.text_color.color1 = "#000000"
-        self.text_color.color2 = "#FFFFFF"
-        self.text_color.is_gradient.set(False)
-        self.text_color.update_color_display()
-        self.text_color.toggle_gradient()
-        
-        self.bg_color.color1 = "#FFFFFF"
-        self.bg_color.color2 = "#FFFFFF"
-        self.bg_color.is_gradient.set(False)
-        self.bg_color.update_color_display()
-        self.bg_color.toggle_gradient()
-        
-        # Hide depth frame
-        self.depth_frame.pack_forget()
-        
-        # Reset canvas
-        self.canvas.config(width=500, height=500)
-        
-        # Update preview
-        self.update_preview()
+        with self._batch():
+            self.logo_text.set("A")
+            self.font_size.set(72)
+            self.is_3d.set(False)
+            self.depth.set(5)
+            self.canvas_width.set(500)
+            self.canvas_height.set(500)
+            
+            # Reset color selectors
+            self.text_color.color1 = "#000000"
+            self.text_color.color2 = "#FFFFFF"
+            self.text_color.is_gradient.set(False)
+            self.text_color.update_color_display()
+            self.text_color.toggle_gradient()
+            
+            self.bg_color.color1 = "#FFFFFF"
+            self.bg_color.color2 = "#FFFFFF"
+            self.bg_color.is_gradient.set(False)
+            self.bg_color.update_color_display()
+            self.bg_color.toggle_gradient()
+            
+            # Hide depth frame
+            self.depth_frame.pack_forget()
+            
+            # Reset canvas
+            self.canvas.config(width=500, height=500)
     
     def _better_font_selection(self, font_path, font_size):
         """Improved font selection with better fallbacks"""
@@ -659,38 +713,50 @@ class LogoDesigner(tk.Tk):
         try:
             font_size = max(10, int(font_size))
         except (ValueError, TypeError):
-            print(f"Invalid font size: {font_size}, using 12")
+            log.debug("Invalid font size: %s, using 12", font_size)
             font_size = 12
         
-        print(f"Creating font with path={font_path}, size={font_size}")
+        log.debug("Creating font with path=%s, size=%s", font_path, font_size)
         
         # Special handling for our internal marker
         if font_path == "__USE_INTERNAL_DEFAULT__":
-            print(f"Using scaled PIL default font for size {font_size}")
+            # The base bitmap and Lanczos resample are identical for a given
+            # size, so reuse the previously built font when we have one
+            cached = self._scaled_font_cache.get((font_path, font_size))
+            if cached is not None:
+                return cached
             
-            # Since we couldn't load a TrueType font, we'll create a bitmap font
-            # that approximates the requested size by using PIL's default font
-            # and scaling it with PIL's image operations
+            # Best option: PIL >= 10 builds its default font at the
+            # requested size directly, no bitmap scaling needed
+            if _PIL_DEFAULT_FONT_ACCEPTS_SIZE:
+                try:
+                    font = ImageFont.load_default(size=font_size)
+                    self._scaled_font_cache[(font_path, font_size)] = font
+                    return font
+                except Exception as e:
+                    log.debug("Error loading sized default font: %s", e)
             
-            # Create a base image with default font of a certain size
-            base_size = 24  # A reasonable base size
-            base_img = Image.new('L', (base_size*10, base_size*2), 0)
-            base_draw = ImageDraw.Draw(base_img)
-            base_font = ImageFont.load_default()
+            # Next best: a real system TTF at the requested size
+            default_path = self._find_default_system_font()
+            if default_path != "__USE_INTERNAL_DEFAULT__":
+                try:
+                    font = _load_truetype(default_path, font_size)
+                    self._scaled_font_cache[(font_path, font_size)] = font
+                    return font
+                except Exception as e:
+                    log.debug("Error loading default system font: %s", e)
             
-            # Draw some text
-            base_draw.text((0, 0), "Aa", font=base_font, fill=255)
+            log.debug("Using scaled PIL default font for size %s", font_size)
             
-            # Scale it to requested size
+            # Since we couldn't load a TrueType font, wrap PIL's default font
+            # in an object that scales its layout metrics to the requested
+            # size; everything else (getmask etc., used by draw.text) is
+            # delegated to the unscaled font
+            base_size = 24  # The default font's nominal size
+            base_font = ImageFont.load_default()
             scale_factor = font_size / base_size
-            scaled_width = int(base_img.width * scale_factor)
-            scaled_height = int(base_img.height * scale_factor)
-            
+
             try:
-                # Try to resize using LANCZOS filter for better quality
-                scaled_img = base_img.resize((scaled_width, scaled_height), 
-                                            Image.Resampling.LANCZOS)
-                
                 # Create a custom font object that mimics PIL's font interface
                 # but returns the scaled dimensions when asked for size
                 class ScaledFont:
@@ -698,8 +764,33 @@ class LogoDesigner(tk.Tk):
                         self.base_font = base_font
                         self.scale_factor = scale_factor
                         self.size = font_size
+                        
+                        # Precompute scaled metrics for printable ASCII so
+                        # per-character layout queries become dict lookups
+                        self._scaled_bbox_cache = {
+                            ch: tuple(int(v * scale_factor) for v in base_font.getbbox(ch))
+                            for ch in string.printable
+                        }
+                        # Resolve the PIL getsize/getbbox API difference once
+                        # here instead of on every getsize call
+                        if hasattr(base_font, 'getsize'):
+                            self._getsize_fallback = self._getsize_via_getsize
+                            self._scaled_size_cache = {
+                                ch: tuple(int(v * scale_factor) for v in base_font.getsize(ch))
+                                for ch in string.printable
+                            }
+                        else:
+                            # PIL 9.0+ removed getsize, derive from the bboxes
+                            self._getsize_fallback = self._getsize_via_getbbox
+                            self._scaled_size_cache = {
+                                ch: (bb[2] - bb[0], bb[3] - bb[1])
+                                for ch, bb in self._scaled_bbox_cache.items()
+                            }
                     
                     def getbbox(self, text):
+                        cached = self._scaled_bbox_cache.get(text)
+                        if cached is not None:
+                            return cached
                         bbox = self.base_font.getbbox(text)
                         return (
                             int(bbox[0] * self.scale_factor),
@@ -709,28 +800,42 @@ class LogoDesigner(tk.Tk):
                         )
                     
                     def getsize(self, text):
-                        if hasattr(self.base_font, 'getsize'):
-                            base_size = self.base_font.getsize(text)
-                            return (
-                                int(base_size[0] * self.scale_factor),
-                                int(base_size[1] * self.scale_factor)
-                            )
-                        else:
-                            # PIL 9.0+ removed getsize, use getbbox instead
-                            bbox = self.getbbox(text)
-                            return (bbox[2] - bbox[0], bbox[3] - bbox[1])
+                        cached = self._scaled_size_cache.get(text)
+                        if cached is not None:
+                            return cached
+                        return self._getsize_fallback(text)
+
+                    def _getsize_via_getsize(self, text):
+                        base_size = self.base_font.getsize(text)
+                        return (
+                            int(base_size[0] * self.scale_factor),
+                            int(base_size[1] * self.scale_factor)
+                        )
+
+                    def _getsize_via_getbbox(self, text):
+                        # PIL 9.0+ removed getsize, use getbbox instead
+                        bbox = self.getbbox(text)
+                        return (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+                    def __getattr__(self, name):
+                        # Anything not overridden here (getmask, getmask2,
+                        # getlength, ...) comes from the unscaled font so
+                        # draw.text can render with this object
+                        return getattr(self.base_font, name)
                 
-                print(f"Created scaled font with size {font_size}")
-                return ScaledFont(base_font, scale_factor)
+                log.debug("Created scaled font with size %s", font_size)
+                font = ScaledFont(base_font, scale_factor)
+                self._scaled_font_cache[(font_path, font_size)] = font
+                return font
                 
             except Exception as e:
-                print(f"Error creating scaled font: {e}")
-                print("Using default font without scaling")
+                log.debug("Error creating scaled font: %s", e)
+                log.debug("Using default font without scaling")
                 return ImageFont.load_default()
                 
         # Special case for the default font
         elif font_path == "default" or font_path.lower() == "default":
-            print(f"Using PIL's default font (may not respect size {font_size})")
+            log.debug("Using PIL's default font (may not respect size %s)", font_size)
             # PIL's default font doesn't support custom sizes well
             # We'll try to create a better default font at the specified size
             try:
@@ -749,31 +854,31 @@ class LogoDesigner(tk.Tk):
                 # Try each system font
                 for system_font in system_fonts:
                     try:
-                        print(f"  - Trying system font: {system_font}")
-                        return ImageFont.truetype(system_font, font_size)
+                        log.debug("  - Trying system font: %s", system_font)
+                        return _load_truetype(system_font, font_size)
                     except Exception as e:
-                        print(f"  - Failed to load {system_font}: {e}")
+                        log.debug("  - Failed to load %s: %s", system_font, e)
                         continue
                 
                 # If none of the above work, try the default PIL approach
-                print("  - All system fonts failed, using PIL default font (size might not apply)")
+                log.debug("  - All system fonts failed, using PIL default font (size might not apply)")
                 # Call our internal method with special marker
                 return self._better_font_selection("__USE_INTERNAL_DEFAULT__", font_size)
                 
             except Exception as e:
-                print(f"  - Error creating default font: {e}")
+                log.debug("  - Error creating default font: %s", e)
                 # Call our internal method with special marker
                 return self._better_font_selection("__USE_INTERNAL_DEFAULT__", font_size)
         
         # For regular font paths
         try:
-            print(f"Loading TrueType font: {font_path}")
-            font = ImageFont.truetype(font_path, font_size)
-            print(f"Successfully loaded font: {font_path} at size {font_size}")
+            log.debug("Loading TrueType font: %s", font_path)
+            font = _load_truetype(font_path, font_size)
+            log.debug("Successfully loaded font: %s at size %s", font_path, font_size)
             return font
         except Exception as e:
-            print(f"Error loading font {font_path} at size {font_size}: {e}")
-            print("Falling back to default font")
+            log.debug("Error loading font %s at size %s: %s", font_path, font_size, e)
+            log.debug("Falling back to default font")
             # Call our internal method with special marker
             return self._better_font_selection("__USE_INTERNAL_DEFAULT__", font_size)
     
@@ -801,152 +906,173 @@ class LogoDesigner(tk.Tk):
         ]
         font_dirs.extend([d for d in user_font_dirs if os.path.exists(d)])
         
-        # Find font files (.ttf, .otf)
+        # Load the persistent probe cache: path -> (mtime, font_name or
+        # None for files FreeType rejected), so unchanged fonts skip the
+        # probe entirely on later launches
+        cache = {}
+        try:
+            with open(self._font_cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+        
+        # Find font files (.ttf, .otf) and their mtimes with an iterative
+        # scandir walk; DirEntry exposes the file type and stat from the
+        # directory read itself, avoiding an extra stat per entry
         font_files = []
-        for font_dir in font_dirs:
-            if os.path.exists(font_dir):
-                try:
-                    for root, _, files in os.walk(font_dir):
-                        for file in files:
-                            if file.lower().endswith(('.ttf', '.otf')):
-                                font_files.append(os.path.join(root, file))
-                except (IOError, OSError, PermissionError):
-                    # Skip directories we can't access
-                    pass
-        
-        # Test each font file
-        for font_file in font_files:
+        stack = [font_dir for font_dir in font_dirs if os.path.exists(font_dir)]
+        while stack:
+            directory = stack.pop()
             try:
-                # Try to create a font to test availability
-                font = ImageFont.truetype(font_file, 12)
-                # Extract font name from path (simplified)
-                font_name = os.path.basename(font_file).split('.')[0]
-                available_fonts.append((font_name, font_file))
-            except Exception:
-                pass
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            name = entry.name.lower()
+                            if name.endswith('.ttf') or name.endswith('.otf'):
+                                try:
+                                    font_files.append((entry.path, entry.stat().st_mtime))
+                                except OSError:
+                                    pass
+            except (IOError, OSError, PermissionError):
+                # Skip directories we can't access
+                continue
+        
+        # Split the files into cache hits and fonts that need probing
+        new_cache = {}
+        to_probe = []
+        for font_file, mtime in font_files:
+            cached = cache.get(font_file)
+            if cached is not None and cached[0] == mtime:
+                new_cache[font_file] = (mtime, cached[1])
+            else:
+                to_probe.append((font_file, mtime))
         
-        # Add some common font names (which PIL might find through its own mechanism)
+        # Common font names PIL might find through its own mechanism
         common_font_names = ["Arial", "Times New Roman", "Courier New", "Verdana", "Georgia", 
                            "Tahoma", "Trebuchet MS", "Impact", "Comic Sans MS"]
         
-        for font_name in common_font_names:
-            try:
-                # Check if we can load the font by name
-                ImageFont.truetype(font_name, 12)
-                available_fonts.append((font_name, font_name))
-            except Exception:
-                pass
+        # Each probe is a file open plus FreeType header parsing, which
+        # releases the GIL, so run them through a thread pool
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            results = executor.map(self._probe_font, [path for path, _ in to_probe])
+            for (font_file, mtime), result in zip(to_probe, results):
+                new_cache[font_file] = (mtime, result[0] if result else None)
+            
+            name_results = list(executor.map(self._probe_font, common_font_names))
         
-        # Add default as a fallback option
-        available_fonts.append(("Default", "default"))
+        for font_file, (mtime, font_name) in new_cache.items():
+            if font_name is not None:
+                available_fonts.append((font_name, font_file))
         
-        # Remove duplicates and sort by font name
-        unique_fonts = []
-        seen_names = set()
+        available_fonts.extend(result for result in name_results if result is not None)
         
-        for name, path in available_fonts:
-            if name not in seen_names:
-                seen_names.add(name)
-                unique_fonts.append((name, path))
+        # Persist the updated cache for the next launch
+        try:
+            os.makedirs(os.path.dirname(self._font_cache_path), exist_ok=True)
+            with open(self._font_cache_path, 'wb') as f:
+                pickle.dump(new_cache, f)
+        except OSError:
+            pass
         
-        return sorted(unique_fonts, key=lambda x: x[0].lower())
+        # Add default as a fallback option
+        available_fonts.append(("Default", "default"))
+        
+        # Remove duplicates in one pass (reversed so the first occurrence
+        # of each name wins) and sort by font name
+        unique_fonts = {name: (name, path) for name, path in reversed(available_fonts)}
+        return sorted(unique_fonts.values(), key=lambda x: x[0].lower())
+    
+    def _probe_font(self, font_path):
+        """Check that a font file (or name) loads; return (name, path) or None"""
+        try:
+            _load_truetype(font_path, 12)
+        except Exception:
+            return None
+        return (os.path.basename(font_path).split('.')[0], font_path)
     
     def _debug_font(self, font_obj, message="Font debug"):
         """Helper method to debug font properties"""
+        if not log.isEnabledFor(logging.DEBUG):
+            return
         try:
-            # Get font attributes if possible
+            # Build the whole report in one buffer so it reaches the log
+            # as a single record instead of one write per line
+            buf = io.StringIO()
             attributes = dir(font_obj)
-            print(f"{message}:")
-            print(f"  - Font type: {type(font_obj)}")
-            print(f"  - Available attributes: {', '.join(attr for attr in attributes if not attr.startswith('_'))}")
-            
+            buf.write(f"{message}:\n")
+            buf.write(f"  - Font type: {type(font_obj)}\n")
+            buf.write(f"  - Available attributes: {', '.join(attr for attr in attributes if not attr.startswith('_'))}\n")
+
             # Try to get size information
             if hasattr(font_obj, 'size'):
-                print(f"  - Size attribute: {font_obj.size}")
-            
+                buf.write(f"  - Size attribute: {font_obj.size}\n")
+
             # Try to get font name
             if hasattr(font_obj, 'getname'):
-                print(f"  - Font name: {font_obj.getname()}")
-                
+                buf.write(f"  - Font name: {font_obj.getname()}\n")
+
             # Test with a sample text
             test_text = "Ag"
             if hasattr(font_obj, 'getbbox'):
                 bbox = font_obj.getbbox(test_text)
-                print(f"  - Bounding box for '{test_text}': {bbox}")
-                print(f"  - Height: {bbox[3] - bbox[1]}")
-                
-            print("") # Empty line for readability
+                buf.write(f"  - Bounding box for '{test_text}': {bbox}\n")
+                buf.write(f"  - Height: {bbox[3] - bbox[1]}\n")
+
+            log.debug("%s", buf.getvalue())
         except Exception as e:
-            print(f"Error in font debug: {e}")
+            log.debug("Error in font debug: %s", e)
     
     def _get_font_path(self, font_name):
         """Get the correct font path for a given font name"""
-        # If we have stored font paths, use them
-        if hasattr(self, 'font_paths') and font_name in self.font_paths:
-            font_path = self.font_paths.get(font_name)
-            print(f"Using font path from dictionary: {font_name} -> {font_path}")
-            if font_path == "default" or font_name.lower() == "default":
-                # Get a real system font path instead of "default"
-                return self._find_default_system_font()
-            return font_path
-        
-        # Handle the Default font specially
+        # Handle the Default font specially: resolve it to a real system
+        # font path instead of the "default" marker
         if font_name.lower() == "default":
             return self._find_default_system_font()
-        
-        # If we get here, just return the name
-        print(f"Using font name directly: {font_name}")
+
+        # font_paths is always populated in __init__, so a single dict
+        # lookup answers everything else; fall back to the raw name
+        font_path = self.font_paths.get(font_name)
+        if font_path is not None:
+            return self._find_default_system_font() if font_path == "default" else font_path
         return font_name
         
     def _find_default_system_font(self):
         """Find a usable system font for the 'Default' option"""
-        print("Finding a suitable system font for 'Default'...")
-        
-        # Try common system font locations with more paths
-        system_fonts = [
-            # Linux fonts - most common locations
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-            "/usr/share/fonts/liberation-sans/LiberationSans-Regular.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-            "/usr/share/fonts/gnu-free/FreeSans.ttf",
-            # Windows fonts
-            "C:\\Windows\\Fonts\\arial.ttf",
-            "C:\\Windows\\Fonts\\segoeui.ttf", 
-            # Mac fonts
-            "/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            # Generic names that PIL might recognize
-            "DejaVuSans.ttf",
-            "Arial.ttf",
-            "Helvetica.ttf",
-            "Arial",
-            "Helvetica"
-        ]
+        # The answer never changes within a run, so probe the path list once
+        if self._default_system_font is not None:
+            return self._default_system_font
         
+        log.debug("Finding a suitable system font for 'Default'...")
+
+        # Only probe the candidates that can exist on this platform, then
+        # the generic names PIL might resolve on its own
+        system_fonts = (_FONT_CANDIDATES_BY_PLATFORM.get(sys.platform, [])
+                        + _GENERIC_FONT_NAMES)
+
         # Try to load each font
         for font_path in system_fonts:
             try:
                 # Just test if we can load it
-                ImageFont.truetype(font_path, 12)
-                print(f"Found system font for 'Default': {font_path}")
+                _load_truetype(font_path, 12)
+                log.debug("Found system font for 'Default': %s", font_path)
+                self._default_system_font = font_path
                 return font_path
             except Exception as e:
-                print(f"Could not load font {font_path}: {e}")
+                log.debug("Could not load font %s: %s", font_path, e)
                 continue
         
         # If no system font works, return a special marker that will
         # tell the better_font_selection method to handle the default case
-        print("No system fonts found, using special handling for default font")
+        log.debug("No system fonts found, using special handling for default font")
+        self._default_system_font = "__USE_INTERNAL_DEFAULT__"
         return "__USE_INTERNAL_DEFAULT__"
 
 
 def main():
     """Main entry point when running as a script or package"""
     # Enable basic logging for PIL
-    import logging
     logging.basicConfig(level=logging.INFO)
     
     # Create the application